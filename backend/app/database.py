@@ -3,14 +3,23 @@ Database module for Rockhound-GO
 Handles PostgreSQL/PostGIS initialization and geospatial query functions
 """
 
+import atexit
+import io
 import os
-from typing import List, Dict, Tuple, Optional, Any
+import math
+import time
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 from contextlib import contextmanager
 import logging
 
+import asyncpg
+import numpy as np
 import psycopg2
 from psycopg2 import sql, extras
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 # Configure logging
@@ -20,10 +29,171 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Ranked ordering for geosite significance. The column is VARCHAR, so sorting
+# on it directly is alphabetical ('low' > 'high'); this CASE maps levels to
+# their actual rank and is mirrored by an expression index in the DDL.
+# Covers the live 'low' < 'moderate' < 'high' < 'critical' scale plus the
+# 'medium'/'exceptional' synonyms that appear in older rows
+SIGNIFICANCE_RANK_SQL = """CASE LOWER(significance_level)
+    WHEN 'critical' THEN 4
+    WHEN 'exceptional' THEN 4
+    WHEN 'high' THEN 3
+    WHEN 'moderate' THEN 2
+    WHEN 'medium' THEN 2
+    WHEN 'low' THEN 1
+    ELSE 0
+END"""
+
+# Distance cache keys are rounded to this many decimal places (~1 m at the
+# equator) before lookup
+DISTANCE_CACHE_PRECISION = 5
+
+# Mean earth radius (IUGG) used by the local haversine distance
+EARTH_RADIUS_METERS = 6371008.8
+
+# Ordered, idempotent schema statements. The whole list runs in one
+# transaction, so a half-created schema can never be observed: either every
+# extension, table and index exists or none of the migration applied
+SCHEMA_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS postgis;",
+    "CREATE EXTENSION IF NOT EXISTS postgis_topology;",
+    """
+    CREATE TABLE IF NOT EXISTS rock_formations (
+        id SERIAL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        description TEXT,
+        location GEOMETRY(POINT, 4326) NOT NULL,
+        rock_type VARCHAR(100),
+        age_period VARCHAR(100),
+        location_geojson TEXT GENERATED ALWAYS AS (ST_AsGeoJSON(location)) STORED,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS geosites (
+        id SERIAL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        description TEXT,
+        location GEOMETRY(POINT, 4326) NOT NULL,
+        area GEOMETRY(POLYGON, 4326),
+        significance_level VARCHAR(50),
+        accessibility VARCHAR(50),
+        location_geojson TEXT GENERATED ALWAYS AS (ST_AsGeoJSON(location)) STORED,
+        area_geojson TEXT GENERATED ALWAYS AS (ST_AsGeoJSON(area)) STORED,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_locations (
+        id SERIAL PRIMARY KEY,
+        user_id INTEGER NOT NULL,
+        location GEOMETRY(POINT, 4326) NOT NULL,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        accuracy FLOAT,
+        location_geojson TEXT GENERATED ALWAYS AS (ST_AsGeoJSON(location)) STORED
+    );
+    """,
+    # Upgrades for databases created on older schema versions: drop the
+    # generated duplicate of rock_formations.location (pure write/storage
+    # overhead, no reader) and add the write-time GeoJSON columns
+    "ALTER TABLE rock_formations DROP COLUMN IF EXISTS coordinates;",
+    """
+    ALTER TABLE rock_formations
+    ADD COLUMN IF NOT EXISTS location_geojson TEXT
+    GENERATED ALWAYS AS (ST_AsGeoJSON(location)) STORED;
+    """,
+    """
+    ALTER TABLE geosites
+    ADD COLUMN IF NOT EXISTS location_geojson TEXT
+    GENERATED ALWAYS AS (ST_AsGeoJSON(location)) STORED;
+    """,
+    """
+    ALTER TABLE geosites
+    ADD COLUMN IF NOT EXISTS area_geojson TEXT
+    GENERATED ALWAYS AS (ST_AsGeoJSON(area)) STORED;
+    """,
+    """
+    ALTER TABLE user_locations
+    ADD COLUMN IF NOT EXISTS location_geojson TEXT
+    GENERATED ALWAYS AS (ST_AsGeoJSON(location)) STORED;
+    """,
+    # Spatial indexes. SP-GiST partitions space instead of boxing it, which
+    # for pure point columns gives smaller indexes and faster builds than
+    # GiST; the polygon column keeps GiST. The old GiST point indexes shared
+    # these names, so they are dropped explicitly — CREATE INDEX IF NOT
+    # EXISTS matches by name only and would silently keep the GiST versions
+    # on existing databases
+    "DROP INDEX IF EXISTS idx_rock_formations_location;",
+    """
+    CREATE INDEX IF NOT EXISTS idx_rock_formations_location_spgist
+    ON rock_formations USING SPGIST(location);
+    """,
+    # Functional geography index serving the ST_DWithin(location::geography,
+    # ...) radius queries; the geometry SP-GiST index cannot cover the cast,
+    # so without this every radius search would seq-scan
+    """
+    CREATE INDEX IF NOT EXISTS idx_rock_formations_location_geog
+    ON rock_formations USING GIST ((location::geography));
+    """,
+    "DROP INDEX IF EXISTS idx_geosites_location;",
+    """
+    CREATE INDEX IF NOT EXISTS idx_geosites_location_spgist
+    ON geosites USING SPGIST(location);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_geosites_area
+    ON geosites USING GIST(area);
+    """,
+    "DROP INDEX IF EXISTS idx_user_locations_location;",
+    """
+    CREATE INDEX IF NOT EXISTS idx_user_locations_location_spgist
+    ON user_locations USING SPGIST(location);
+    """,
+    # Expression index matching the significance ranking used to order
+    # geosite results; the v1 index was built over a CASE that did not rank
+    # 'critical'/'moderate' and must be dropped, since IF NOT EXISTS matches
+    # by name and would keep the stale expression
+    "DROP INDEX IF EXISTS idx_geosites_significance_rank;",
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_geosites_significance_rank_v2
+    ON geosites (({SIGNIFICANCE_RANK_SQL}));
+    """,
+    # Functional index matching the LOWER(rock_type) predicate in
+    # find_formations_by_rock_type, which would otherwise seq-scan the table
+    """
+    CREATE INDEX IF NOT EXISTS idx_rock_formations_rock_type_lower
+    ON rock_formations (LOWER(rock_type));
+    """,
+    # BRIN suits the append-only tracking table: timestamps correlate with
+    # physical row order, so the index stays a few pages instead of a btree
+    # over every row. The old btree shared this name, so it is dropped
+    # explicitly — CREATE INDEX IF NOT EXISTS matches by name only and would
+    # silently keep the btree on existing databases. pages_per_range = 32
+    # (vs the default 128) quarters the range each entry summarizes, cutting
+    # heap pages rechecked per time-window lookup; an index already built
+    # with the default keeps it until manually reindexed, which only costs
+    # those wider rechecks
+    "DROP INDEX IF EXISTS idx_user_locations_timestamp;",
+    """
+    CREATE INDEX IF NOT EXISTS idx_user_locations_timestamp_brin
+    ON user_locations USING BRIN(timestamp) WITH (pages_per_range = 32);
+    """,
+    # Covering index for get_user_location_history: the (user_id, timestamp
+    # DESC) keys match its WHERE/ORDER BY exactly and the INCLUDEd payload
+    # columns let the scan answer without touching the heap at all
+    """
+    CREATE INDEX IF NOT EXISTS idx_user_locations_user_ts
+    ON user_locations (user_id, timestamp DESC)
+    INCLUDE (id, location_geojson, accuracy);
+    """,
+)
+
 
 class DatabaseConfig:
     """Configuration class for database connection parameters"""
-    
+
     def __init__(self):
         self.host = os.getenv('DB_HOST', 'localhost')
         self.port = os.getenv('DB_PORT', '5432')
@@ -31,7 +201,37 @@ class DatabaseConfig:
         self.user = os.getenv('DB_USER', 'postgres')
         self.password = os.getenv('DB_PASSWORD', 'password')
         self.min_connections = int(os.getenv('DB_MIN_CONNECTIONS', '2'))
-        self.max_connections = int(os.getenv('DB_MAX_CONNECTIONS', '10'))
+        self.max_connections = int(
+            os.getenv('DB_MAX_CONNECTIONS', str(self._default_max_connections()))
+        )
+
+    def _default_max_connections(self) -> int:
+        """
+        Derive a pool ceiling from the host rather than a fixed constant
+
+        Uses the (2 * cores) + 1 sizing rule, split across server workers
+        (WEB_CONCURRENCY) since each worker process gets its own pool;
+        DB_MAX_CONNECTIONS still overrides when set
+
+        Returns:
+            Per-process maximum pool size (at least min_connections)
+        """
+        cores = os.cpu_count() or 2
+        workers = max(1, int(os.getenv('WEB_CONCURRENCY', '1')))
+        return max(self.min_connections, (2 * cores + 1) // workers)
+
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has PREPAREd
+
+    Pooled connections are long-lived, so preparing each hot statement
+    once per connection amortizes the PARSE/plan step across every
+    subsequent EXECUTE on that connection
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: set = set()
 
 
 class DatabaseManager:
@@ -45,20 +245,21 @@ class DatabaseManager:
             config: DatabaseConfig instance (creates default if None)
         """
         self.config = config or DatabaseConfig()
-        self.connection_pool: Optional[SimpleConnectionPool] = None
+        self.connection_pool: Optional[ThreadedConnectionPool] = None
         self._initialize_pool()
-    
+
     def _initialize_pool(self) -> None:
-        """Initialize connection pool"""
+        """Initialize thread-safe connection pool"""
         try:
-            self.connection_pool = SimpleConnectionPool(
+            self.connection_pool = ThreadedConnectionPool(
                 self.config.min_connections,
                 self.config.max_connections,
                 host=self.config.host,
                 port=self.config.port,
                 database=self.config.database,
                 user=self.config.user,
-                password=self.config.password
+                password=self.config.password,
+                connection_factory=PreparedConnection
             )
             logger.info("Database connection pool initialized successfully")
         except Exception as e:
@@ -86,111 +287,30 @@ class DatabaseManager:
             if conn:
                 self.connection_pool.putconn(conn)
     
-    def initialize_postgis(self) -> bool:
-        """
-        Initialize PostGIS extension and create necessary spatial tables/indexes
-        
-        Returns:
-            bool: True if successful, False otherwise
+    def initialize_schema(self) -> bool:
         """
-        try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Enable PostGIS extension
-                    cur.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
-                    cur.execute("CREATE EXTENSION IF NOT EXISTS postgis_topology;")
-                    
-                    logger.info("PostGIS extensions enabled")
-                    conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize PostGIS: {e}")
-            return False
-    
-    def create_spatial_tables(self) -> bool:
-        """
-        Create spatial tables for rock formations and geosites
-        
+        Run the full schema migration (extensions, tables, indexes)
+
+        Every statement in SCHEMA_DDL executes on one connection and commits
+        once, so the schema is applied atomically; a failure rolls the whole
+        migration back instead of leaving tables without their indexes
+
         Returns:
             bool: True if successful, False otherwise
         """
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    # Create rock formations table
-                    cur.execute("""
-                        CREATE TABLE IF NOT EXISTS rock_formations (
-                            id SERIAL PRIMARY KEY,
-                            name VARCHAR(255) NOT NULL,
-                            description TEXT,
-                            location GEOMETRY(POINT, 4326) NOT NULL,
-                            rock_type VARCHAR(100),
-                            age_period VARCHAR(100),
-                            coordinates GEOMETRY(POINT, 4326) GENERATED ALWAYS AS (location) STORED,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        );
-                    """)
-                    
-                    # Create geosites table
-                    cur.execute("""
-                        CREATE TABLE IF NOT EXISTS geosites (
-                            id SERIAL PRIMARY KEY,
-                            name VARCHAR(255) NOT NULL,
-                            description TEXT,
-                            location GEOMETRY(POINT, 4326) NOT NULL,
-                            area GEOMETRY(POLYGON, 4326),
-                            significance_level VARCHAR(50),
-                            accessibility VARCHAR(50),
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        );
-                    """)
-                    
-                    # Create user locations tracking table
-                    cur.execute("""
-                        CREATE TABLE IF NOT EXISTS user_locations (
-                            id SERIAL PRIMARY KEY,
-                            user_id INTEGER NOT NULL,
-                            location GEOMETRY(POINT, 4326) NOT NULL,
-                            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            accuracy FLOAT
-                        );
-                    """)
-                    
-                    # Create spatial indexes
-                    cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_rock_formations_location 
-                        ON rock_formations USING GIST(location);
-                    """)
-                    
-                    cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_geosites_location 
-                        ON geosites USING GIST(location);
-                    """)
-                    
-                    cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_geosites_area 
-                        ON geosites USING GIST(area);
-                    """)
-                    
-                    cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_user_locations_location 
-                        ON user_locations USING GIST(location);
-                    """)
-                    
-                    cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_user_locations_timestamp 
-                        ON user_locations(timestamp);
-                    """)
-                    
-                    logger.info("Spatial tables and indexes created successfully")
+                    for statement in SCHEMA_DDL:
+                        cur.execute(statement)
+
+                    logger.info("Database schema initialized successfully")
                     conn.commit()
             return True
         except Exception as e:
-            logger.error(f"Failed to create spatial tables: {e}")
+            logger.error(f"Failed to initialize database schema: {e}")
             return False
-    
+
     def close_pool(self) -> None:
         """Close all connections in the pool"""
         if self.connection_pool:
@@ -198,57 +318,276 @@ class DatabaseManager:
             logger.info("Connection pool closed")
 
 
+class AsyncDatabaseManager:
+    """Async counterpart to DatabaseManager backed by an asyncpg pool
+
+    Intended for the FastAPI/ASGI path: queries issued from concurrent
+    request handlers run in parallel instead of serializing on
+    Python-level pool locks
+    """
+
+    def __init__(self, config: Optional[DatabaseConfig] = None):
+        """
+        Initialize AsyncDatabaseManager (pool is created lazily)
+
+        Args:
+            config: DatabaseConfig instance (creates default if None)
+        """
+        self.config = config or DatabaseConfig()
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def initialize(self) -> None:
+        """Create the asyncpg connection pool"""
+        try:
+            self.pool = await asyncpg.create_pool(
+                host=self.config.host,
+                port=int(self.config.port),
+                database=self.config.database,
+                user=self.config.user,
+                password=self.config.password,
+                min_size=self.config.min_connections,
+                max_size=self.config.max_connections
+            )
+            logger.info("Async database connection pool initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize async connection pool: {e}")
+            raise
+
+    async def close(self) -> None:
+        """Close the asyncpg connection pool"""
+        if self.pool:
+            await self.pool.close()
+            logger.info("Async connection pool closed")
+
+    async def find_nearby_formations(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_meters: float = 5000
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of GeospatialQueryManager.find_nearby_formations
+
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+            radius_meters: Search radius in meters (default: 5km)
+
+        Returns:
+            List of rock formations with distance information
+        """
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch("""
+                    WITH origin AS (
+                        SELECT ST_SetSRID(ST_Point($1, $2), 4326)::geography AS geog
+                    )
+                    SELECT
+                        f.id,
+                        f.name,
+                        f.description,
+                        f.rock_type,
+                        f.age_period,
+                        f.location_geojson,
+                        ST_Distance(f.location::geography, origin.geog) as distance_meters
+                    FROM rock_formations f, origin
+                    WHERE ST_DWithin(f.location::geography, origin.geog, $3)
+                    ORDER BY distance_meters ASC;
+                """, longitude, latitude, radius_meters)
+
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error finding nearby formations (async): {e}")
+            return []
+
+    async def find_geosites_in_area(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of GeospatialQueryManager.find_geosites_in_area
+
+        Args:
+            min_lat: Minimum latitude
+            min_lon: Minimum longitude
+            max_lat: Maximum latitude
+            max_lon: Maximum longitude
+            limit: Return only the top-N most significant sites (None for all)
+
+        Returns:
+            List of geosites within the bounding box
+        """
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(f"""
+                    SELECT
+                        id,
+                        name,
+                        description,
+                        significance_level,
+                        accessibility,
+                        location_geojson,
+                        area_geojson
+                    FROM geosites
+                    WHERE location && ST_MakeEnvelope($1, $2, $3, $4, 4326)
+                    ORDER BY {SIGNIFICANCE_RANK_SQL} DESC
+                    LIMIT $5;
+                """, min_lon, min_lat, max_lon, max_lat, limit)
+
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error finding geosites in area (async): {e}")
+            return []
+
+    async def get_user_location_history(
+        self,
+        user_id: int,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of GeospatialQueryManager.get_user_location_history
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of records to return
+
+        Returns:
+            List of user location records
+        """
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch("""
+                    SELECT
+                        id,
+                        user_id,
+                        location_geojson,
+                        timestamp,
+                        accuracy
+                    FROM user_locations
+                    WHERE user_id = $1
+                    ORDER BY timestamp DESC
+                    LIMIT $2;
+                """, user_id, limit)
+
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error retrieving user location history (async): {e}")
+            return []
+
+
 class GeospatialQueryManager:
     """Manages geospatial queries for rock formations and geosites"""
     
+    # Buffered location writes: points are appended to an in-process deque and
+    # flushed in batches, so a flush costs one round-trip instead of one per point
+    LOCATION_FLUSH_SIZE = int(os.getenv('LOCATION_FLUSH_SIZE', '500'))
+    LOCATION_FLUSH_INTERVAL = float(os.getenv('LOCATION_FLUSH_INTERVAL', '5.0'))
+
+    # Hot geosite tiles are cached in-process as row lists plus NumPy
+    # coordinate arrays; sub-queries inside a cached tile are answered with a
+    # vectorized bbox mask instead of a round-trip to PostgreSQL
+    GEOSITE_TILE_DEGREES = float(os.getenv('GEOSITE_TILE_DEGREES', '1.0'))
+    GEOSITE_TILE_TTL = float(os.getenv('GEOSITE_TILE_TTL', '60.0'))
+    GEOSITE_TILE_CACHE_MAX = int(os.getenv('GEOSITE_TILE_CACHE_MAX', '64'))
+
+    # Statements PREPAREd once per pooled connection; subsequent calls on the
+    # same connection EXECUTE the cached plan instead of re-parsing
+    PREPARED_STATEMENTS = {
+        'distance_between_points': """
+            SELECT ST_Distance(
+                ST_SetSRID(ST_Point($1, $2), 4326)::geography,
+                ST_SetSRID(ST_Point($3, $4), 4326)::geography
+            ) as distance
+        """,
+        'insert_rock_formation': """
+            INSERT INTO rock_formations
+            (name, location, rock_type, age_period, description)
+            VALUES ($1, ST_SetSRID(ST_Point($2, $3), 4326), $4, $5, $6)
+            RETURNING id
+        """,
+    }
+
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize with DatabaseManager instance
-        
+
         Args:
             db_manager: DatabaseManager instance
         """
         self.db_manager = db_manager
+        self._location_buffer: deque = deque()
+        self._location_buffer_lock = threading.Lock()
+        self._location_flush_thread: Optional[threading.Thread] = None
+        self._location_flush_stop = threading.Event()
+        self._shutdown_registered = False
+        self._geosite_tile_cache: Dict[Tuple[int, int, int, int], Tuple[float, List[Tuple[Any, ...]], Any, Any]] = {}
+        self._tile_cache_lock = threading.Lock()
+
+    def _ensure_prepared(self, conn, name: str) -> None:
+        """
+        PREPARE a named statement on this connection if not already done
+
+        Args:
+            conn: Connection from the pool (PreparedConnection)
+            name: Key into PREPARED_STATEMENTS
+        """
+        prepared = getattr(conn, 'prepared_statements', None)
+        if prepared is None or name in prepared:
+            return
+        with conn.cursor() as cur:
+            cur.execute(f"PREPARE {name} AS {self.PREPARED_STATEMENTS[name]}")
+        prepared.add(name)
     
     def find_nearby_formations(
         self,
         latitude: float,
         longitude: float,
-        radius_meters: float = 5000
-    ) -> List[Dict[str, Any]]:
+        radius_meters: float = 5000,
+        fetch_size: int = 256
+    ) -> List[Tuple[Any, ...]]:
         """
         Find rock formations within a specified radius of a location
-        
+
         Args:
             latitude: Latitude coordinate
             longitude: Longitude coordinate
             radius_meters: Search radius in meters (default: 5km)
-        
+            fetch_size: Rows fetched per server round-trip; raise for wide
+                radii that return thousands of rows, lower to bound memory
+
         Returns:
-            List of rock formations with distance information
+            List of named tuple records with distance information; rows are
+            plain tuples with attribute access, avoiding a dict per row
         """
         try:
             with self.db_manager.get_connection() as conn:
-                with conn.cursor(cursor_factory=extras.RealDictCursor) as cur:
+                with conn.cursor(
+                    name="nearby_formations",
+                    cursor_factory=extras.NamedTupleCursor
+                ) as cur:
+                    cur.itersize = fetch_size
                     cur.execute("""
-                        SELECT 
-                            id,
-                            name,
-                            description,
-                            rock_type,
-                            age_period,
-                            ST_AsGeoJSON(location) as location_geojson,
-                            ST_Distance(location, ST_SetSRID(ST_Point(%s, %s), 4326)) as distance_meters
-                        FROM rock_formations
-                        WHERE ST_DWithin(
-                            location,
-                            ST_SetSRID(ST_Point(%s, %s), 4326),
-                            %s
+                        WITH origin AS (
+                            SELECT ST_SetSRID(ST_Point(%s, %s), 4326)::geography AS geog
                         )
+                        SELECT
+                            f.id,
+                            f.name,
+                            f.description,
+                            f.rock_type,
+                            f.age_period,
+                            f.location_geojson,
+                            ST_Distance(f.location::geography, origin.geog) as distance_meters
+                        FROM rock_formations f, origin
+                        WHERE ST_DWithin(f.location::geography, origin.geog, %s)
                         ORDER BY distance_meters ASC;
-                    """, (longitude, latitude, longitude, latitude, radius_meters))
-                    
-                    return cur.fetchall()
+                    """, (longitude, latitude, radius_meters))
+
+                    return list(cur)
         except Exception as e:
             logger.error(f"Error finding nearby formations: {e}")
             return []
@@ -258,86 +597,223 @@ class GeospatialQueryManager:
         min_lat: float,
         min_lon: float,
         max_lat: float,
-        max_lon: float
-    ) -> List[Dict[str, Any]]:
+        max_lon: float,
+        limit: Optional[int] = None,
+        fetch_size: int = 256,
+        use_cache: bool = False
+    ) -> List[Tuple[Any, ...]]:
         """
         Find geosites within a bounding box
-        
+
         Args:
             min_lat: Minimum latitude
             min_lon: Minimum longitude
             max_lat: Maximum latitude
             max_lon: Maximum longitude
-        
+            limit: Return only the top-N most significant sites (None for all);
+                the rank expression index makes this an early-terminating scan
+            fetch_size: Rows fetched per server round-trip; raise for large
+                bounding boxes, lower to bound memory
+            use_cache: Serve from the in-process tile cache when possible;
+                results may lag the database by up to GEOSITE_TILE_TTL seconds
+
         Returns:
-            List of geosites within the bounding box
+            List of geosite records (named tuples) within the bounding box
         """
         try:
-            with self.db_manager.get_connection() as conn:
-                with conn.cursor(cursor_factory=extras.RealDictCursor) as cur:
-                    cur.execute("""
-                        SELECT 
-                            id,
-                            name,
-                            description,
-                            significance_level,
-                            accessibility,
-                            ST_AsGeoJSON(location) as location_geojson,
-                            ST_AsGeoJSON(area) as area_geojson
-                        FROM geosites
-                        WHERE ST_Intersects(
-                            location,
-                            ST_MakeEnvelope(%s, %s, %s, %s, 4326)
-                        )
-                        ORDER BY significance_level DESC;
-                    """, (min_lon, min_lat, max_lon, max_lat))
-                    
-                    return cur.fetchall()
+            if use_cache:
+                return self._find_geosites_cached(
+                    min_lat, min_lon, max_lat, max_lon, limit, fetch_size
+                )
+            return self._query_geosites_in_area(
+                min_lat, min_lon, max_lat, max_lon, limit, fetch_size
+            )
         except Exception as e:
             logger.error(f"Error finding geosites in area: {e}")
             return []
-    
+
+    def _query_geosites_in_area(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int],
+        fetch_size: int
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Run the bounding-box query, raising on failure
+
+        Kept separate from the public wrapper so the tile cache can tell a
+        failed query from a genuinely empty area and never cache the former
+
+        Args:
+            min_lat: Minimum latitude
+            min_lon: Minimum longitude
+            max_lat: Maximum latitude
+            max_lon: Maximum longitude
+            limit: Maximum rows to return (None for all)
+            fetch_size: Rows fetched per server round-trip
+
+        Returns:
+            List of geosite records (named tuples) within the bounding box
+        """
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor(
+                name="geosites_in_area",
+                cursor_factory=extras.NamedTupleCursor
+            ) as cur:
+                cur.itersize = fetch_size
+                # LIMIT NULL means no limit in PostgreSQL
+                cur.execute(f"""
+                    SELECT
+                        id,
+                        name,
+                        description,
+                        significance_level,
+                        accessibility,
+                        ST_X(location) as longitude,
+                        ST_Y(location) as latitude,
+                        location_geojson,
+                        area_geojson
+                    FROM geosites
+                    WHERE location && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
+                    ORDER BY {SIGNIFICANCE_RANK_SQL} DESC
+                    LIMIT %s;
+                """, (min_lon, min_lat, max_lon, max_lat, limit))
+
+                return list(cur)
+
+    def _find_geosites_cached(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        limit: Optional[int],
+        fetch_size: int
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Serve a bounding-box query from the in-process tile cache
+
+        The requested bbox is widened to a cover of GEOSITE_TILE_DEGREES
+        tiles; the tile is fetched once and repeat queries inside it are
+        answered by a vectorized NumPy bbox mask with no database round-trip
+
+        Args:
+            min_lat: Minimum latitude
+            min_lon: Minimum longitude
+            max_lat: Maximum latitude
+            max_lon: Maximum longitude
+            limit: Cap applied after the bbox mask (rows are rank-ordered)
+            fetch_size: Passed through on a cache miss
+
+        Returns:
+            List of geosite records (named tuples) within the bounding box
+        """
+        tile = self.GEOSITE_TILE_DEGREES
+        tile_key = (
+            math.floor(min_lon / tile),
+            math.floor(min_lat / tile),
+            math.ceil(max_lon / tile),
+            math.ceil(max_lat / tile)
+        )
+
+        with self._tile_cache_lock:
+            entry = self._geosite_tile_cache.get(tile_key)
+        if entry is None or time.time() - entry[0] > self.GEOSITE_TILE_TTL:
+            # The query itself runs outside the lock so concurrent requests
+            # for other tiles are not serialized on it
+            try:
+                rows = self._query_geosites_in_area(
+                    tile_key[1] * tile,
+                    tile_key[0] * tile,
+                    tile_key[3] * tile,
+                    tile_key[2] * tile,
+                    limit=None,
+                    fetch_size=fetch_size
+                )
+            except Exception as e:
+                # Never cache the failure as an empty tile; serve the stale
+                # entry if there is one
+                logger.error(f"Error refreshing geosite tile {tile_key}: {e}")
+                if entry is None:
+                    return []
+            else:
+                lons = np.array([row.longitude for row in rows], dtype=np.float64)
+                lats = np.array([row.latitude for row in rows], dtype=np.float64)
+                entry = (time.time(), rows, lons, lats)
+                with self._tile_cache_lock:
+                    self._evict_stale_tiles()
+                    self._geosite_tile_cache[tile_key] = entry
+
+        _, rows, lons, lats = entry
+        mask = (
+            (lons >= min_lon) & (lons <= max_lon) &
+            (lats >= min_lat) & (lats <= max_lat)
+        )
+        matches = [row for row, keep in zip(rows, mask) if keep]
+        return matches[:limit] if limit is not None else matches
+
+    def _evict_stale_tiles(self) -> None:
+        """Drop expired tiles, then the oldest past the cache cap
+
+        Caller must hold _tile_cache_lock
+        """
+        cache = self._geosite_tile_cache
+        now = time.time()
+        for key in [k for k, v in cache.items() if now - v[0] > self.GEOSITE_TILE_TTL]:
+            del cache[key]
+        while len(cache) >= self.GEOSITE_TILE_CACHE_MAX:
+            del cache[min(cache, key=lambda k: cache[k][0])]
+
     def find_formations_by_rock_type(
         self,
         rock_type: str,
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
-        radius_meters: float = 10000
-    ) -> List[Dict[str, Any]]:
+        radius_meters: float = 10000,
+        fetch_size: int = 256
+    ) -> List[Tuple[Any, ...]]:
         """
         Find rock formations by type, optionally filtered by proximity
-        
+
         Args:
             rock_type: Type of rock (e.g., 'granite', 'basalt')
             latitude: Optional latitude for proximity filter
             longitude: Optional longitude for proximity filter
             radius_meters: Search radius if location provided
-        
+            fetch_size: Rows fetched per server round-trip; raise for common
+                rock types with many matches, lower to bound memory
+
         Returns:
-            List of matching rock formations
+            List of matching rock formation records (named tuples)
         """
         try:
             with self.db_manager.get_connection() as conn:
-                with conn.cursor(cursor_factory=extras.RealDictCursor) as cur:
+                with conn.cursor(
+                    name="formations_by_rock_type",
+                    cursor_factory=extras.NamedTupleCursor
+                ) as cur:
+                    cur.itersize = fetch_size
                     if latitude and longitude:
                         cur.execute("""
-                            SELECT 
-                                id,
-                                name,
-                                description,
-                                rock_type,
-                                age_period,
-                                ST_AsGeoJSON(location) as location_geojson,
-                                ST_Distance(location, ST_SetSRID(ST_Point(%s, %s), 4326)) as distance_meters
-                            FROM rock_formations
-                            WHERE LOWER(rock_type) = LOWER(%s)
-                            AND ST_DWithin(
-                                location,
-                                ST_SetSRID(ST_Point(%s, %s), 4326),
-                                %s
+                            WITH origin AS (
+                                SELECT ST_SetSRID(ST_Point(%s, %s), 4326)::geography AS geog
                             )
+                            SELECT
+                                f.id,
+                                f.name,
+                                f.description,
+                                f.rock_type,
+                                f.age_period,
+                                f.location_geojson,
+                                ST_Distance(f.location::geography, origin.geog) as distance_meters
+                            FROM rock_formations f, origin
+                            WHERE LOWER(f.rock_type) = LOWER(%s)
+                            AND ST_DWithin(f.location::geography, origin.geog, %s)
                             ORDER BY distance_meters ASC;
-                        """, (longitude, latitude, rock_type, longitude, latitude, radius_meters))
+                        """, (longitude, latitude, rock_type, radius_meters))
                     else:
                         cur.execute("""
                             SELECT 
@@ -346,13 +822,13 @@ class GeospatialQueryManager:
                                 description,
                                 rock_type,
                                 age_period,
-                                ST_AsGeoJSON(location) as location_geojson
+                                location_geojson
                             FROM rock_formations
                             WHERE LOWER(rock_type) = LOWER(%s)
                             ORDER BY name ASC;
                         """, (rock_type,))
-                    
-                    return cur.fetchall()
+
+                    return list(cur)
         except Exception as e:
             logger.error(f"Error finding formations by rock type: {e}")
             return []
@@ -362,30 +838,43 @@ class GeospatialQueryManager:
         lat1: float,
         lon1: float,
         lat2: float,
-        lon2: float
+        lon2: float,
+        use_postgis: bool = False
     ) -> Optional[float]:
         """
-        Calculate distance between two geographic points
-        
+        Calculate distance in meters between two geographic points
+
+        Computed locally with the haversine formula by default, so no
+        database round-trip at all; pass use_postgis=True for geodesic
+        (ellipsoidal) accuracy via ST_Distance on geography
+
         Args:
             lat1: First point latitude
             lon1: First point longitude
             lat2: Second point latitude
             lon2: Second point longitude
-        
+            use_postgis: Compute the distance in PostGIS instead of locally
+
         Returns:
             Distance in meters, or None if calculation fails
         """
+        if not use_postgis:
+            # Round to ~1 m so repeat queries from a hot origin share a cache
+            # entry despite GPS jitter; the PostGIS path below is uncached and
+            # exists for accuracy, so it gets the coordinates untouched
+            return _haversine_meters(*(
+                round(coord, DISTANCE_CACHE_PRECISION)
+                for coord in (lat1, lon1, lat2, lon2)
+            ))
         try:
             with self.db_manager.get_connection() as conn:
+                self._ensure_prepared(conn, 'distance_between_points')
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT ST_Distance(
-                            ST_SetSRID(ST_Point(%s, %s), 4326),
-                            ST_SetSRID(ST_Point(%s, %s), 4326)
-                        ) as distance;
-                    """, (lon1, lat1, lon2, lat2))
-                    
+                    cur.execute(
+                        "EXECUTE distance_between_points (%s, %s, %s, %s);",
+                        (lon1, lat1, lon2, lat2)
+                    )
+
                     result = cur.fetchone()
                     return result[0] if result else None
         except Exception as e:
@@ -417,21 +906,165 @@ class GeospatialQueryManager:
         """
         try:
             with self.db_manager.get_connection() as conn:
+                self._ensure_prepared(conn, 'insert_rock_formation')
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO rock_formations 
-                        (name, location, rock_type, age_period, description)
-                        VALUES (%s, ST_SetSRID(ST_Point(%s, %s), 4326), %s, %s, %s)
-                        RETURNING id;
-                    """, (name, longitude, latitude, rock_type, age_period, description))
-                    
+                    cur.execute(
+                        "EXECUTE insert_rock_formation (%s, %s, %s, %s, %s, %s);",
+                        (name, longitude, latitude, rock_type, age_period, description)
+                    )
+
                     result = cur.fetchone()
                     conn.commit()
                     return result[0] if result else None
         except Exception as e:
             logger.error(f"Error adding rock formation: {e}")
             return None
-    
+
+    def add_rock_formations_bulk(
+        self,
+        formations: List[Tuple[str, float, float, str, str, Optional[str]]]
+    ) -> List[int]:
+        """
+        Add multiple rock formations in a single multi-row INSERT
+
+        Amortizes per-statement parse/plan overhead and server round-trips
+        across the whole batch instead of paying them per row
+
+        Args:
+            formations: List of (name, latitude, longitude, rock_type,
+                age_period, description) tuples
+
+        Returns:
+            List of inserted formation IDs (empty on failure)
+        """
+        if not formations:
+            return []
+        try:
+            rows = [
+                (name, lon, lat, rock_type, age_period, description)
+                for name, lat, lon, rock_type, age_period, description in formations
+            ]
+            with self.db_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    results = extras.execute_values(
+                        cur,
+                        """
+                        INSERT INTO rock_formations
+                        (name, location, rock_type, age_period, description)
+                        VALUES %s
+                        RETURNING id;
+                        """,
+                        rows,
+                        template="(%s, ST_SetSRID(ST_Point(%s, %s), 4326), %s, %s, %s)",
+                        fetch=True,
+                        page_size=256
+                    )
+
+                    conn.commit()
+                    return [row[0] for row in results]
+        except Exception as e:
+            logger.error(f"Error adding rock formations in bulk: {e}")
+            return []
+
+    @staticmethod
+    def _copy_escape(value: Optional[Any]) -> str:
+        """Escape a value for PostgreSQL COPY text format (None becomes \\N)"""
+        if value is None:
+            return r'\N'
+        return (
+            str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r')
+        )
+
+    def copy_rock_formations(
+        self,
+        formations: List[Tuple[str, float, float, str, str, Optional[str]]]
+    ) -> int:
+        """
+        Bulk-load rock formations with COPY FROM STDIN
+
+        COPY streams the whole batch through a single command, bypassing
+        per-statement parsing entirely; for large imports it is faster still
+        than multi-row INSERTs. Geometry is passed as EWKT, which the
+        geometry column's input function parses server-side
+
+        Args:
+            formations: List of (name, latitude, longitude, rock_type,
+                age_period, description) tuples
+
+        Returns:
+            Number of rows loaded (0 on failure)
+        """
+        if not formations:
+            return 0
+        try:
+            buf = io.StringIO()
+            for name, lat, lon, rock_type, age_period, description in formations:
+                point = f"SRID=4326;POINT({float(lon)} {float(lat)})"
+                buf.write('\t'.join(
+                    self._copy_escape(value)
+                    for value in (name, point, rock_type, age_period, description)
+                ))
+                buf.write('\n')
+            buf.seek(0)
+
+            with self.db_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.copy_expert("""
+                        COPY rock_formations
+                        (name, location, rock_type, age_period, description)
+                        FROM STDIN
+                    """, buf)
+
+                    conn.commit()
+                    return cur.rowcount
+        except Exception as e:
+            logger.error(f"Error copying rock formations: {e}")
+            return 0
+
+    def copy_user_locations(
+        self,
+        points: List[Tuple[int, float, float, Optional[float]]]
+    ) -> int:
+        """
+        Bulk-load user location points with COPY FROM STDIN
+
+        Args:
+            points: List of (user_id, latitude, longitude, accuracy) tuples
+
+        Returns:
+            Number of rows loaded (0 on failure)
+        """
+        if not points:
+            return 0
+        try:
+            buf = io.StringIO()
+            for user_id, lat, lon, accuracy in points:
+                point = f"SRID=4326;POINT({float(lon)} {float(lat)})"
+                buf.write('\t'.join(
+                    self._copy_escape(value)
+                    for value in (user_id, point, accuracy)
+                ))
+                buf.write('\n')
+            buf.seek(0)
+
+            with self.db_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.copy_expert("""
+                        COPY user_locations
+                        (user_id, location, accuracy)
+                        FROM STDIN
+                    """, buf)
+
+                    conn.commit()
+                    return cur.rowcount
+        except Exception as e:
+            logger.error(f"Error copying user locations: {e}")
+            return 0
+
     def add_geosite(
         self,
         name: str,
@@ -461,16 +1094,21 @@ class GeospatialQueryManager:
             with self.db_manager.get_connection() as conn:
                 with conn.cursor() as cur:
                     if area_coords:
-                        # Convert coordinates to WKT polygon format
-                        coords_str = ", ".join([f"{lon} {lat}" for lat, lon in area_coords])
-                        area_geom = f"ST_SetSRID(ST_GeomFromText('POLYGON(({coords_str})'), 4326)"
-                        
-                        cur.execute(f"""
-                            INSERT INTO geosites 
+                        # Coerce to float so the WKT can only contain numbers,
+                        # and close the ring if the caller left it open
+                        ring = [(float(lat), float(lon)) for lat, lon in area_coords]
+                        if ring[0] != ring[-1]:
+                            ring.append(ring[0])
+                        coords_str = ", ".join(f"{lon} {lat}" for lat, lon in ring)
+                        area_wkt = f"POLYGON(({coords_str}))"
+
+                        cur.execute("""
+                            INSERT INTO geosites
                             (name, location, area, significance_level, accessibility, description)
-                            VALUES (%s, ST_SetSRID(ST_Point(%s, %s), 4326), {area_geom}, %s, %s, %s)
+                            VALUES (%s, ST_SetSRID(ST_Point(%s, %s), 4326),
+                                    ST_SetSRID(ST_GeomFromText(%s), 4326), %s, %s, %s)
                             RETURNING id;
-                        """, (name, longitude, latitude, significance_level, accessibility, description))
+                        """, (name, longitude, latitude, area_wkt, significance_level, accessibility, description))
                     else:
                         cur.execute("""
                             INSERT INTO geosites 
@@ -485,7 +1123,93 @@ class GeospatialQueryManager:
         except Exception as e:
             logger.error(f"Error adding geosite: {e}")
             return None
-    
+
+    def add_geosites_bulk(
+        self,
+        geosites: List[Tuple[str, float, float, str, str, Optional[str]]]
+    ) -> List[int]:
+        """
+        Add multiple point geosites in a single multi-row INSERT
+
+        Geosites needing a polygon area should go through add_geosite;
+        this path covers the common point-only import case
+
+        Args:
+            geosites: List of (name, latitude, longitude, significance_level,
+                accessibility, description) tuples
+
+        Returns:
+            List of inserted geosite IDs (empty on failure)
+        """
+        if not geosites:
+            return []
+        try:
+            rows = [
+                (name, lon, lat, significance, accessibility, description)
+                for name, lat, lon, significance, accessibility, description in geosites
+            ]
+            with self.db_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    results = extras.execute_values(
+                        cur,
+                        """
+                        INSERT INTO geosites
+                        (name, location, significance_level, accessibility, description)
+                        VALUES %s
+                        RETURNING id;
+                        """,
+                        rows,
+                        template="(%s, ST_SetSRID(ST_Point(%s, %s), 4326), %s, %s, %s)",
+                        fetch=True,
+                        page_size=256
+                    )
+
+                    conn.commit()
+                    return [row[0] for row in results]
+        except Exception as e:
+            logger.error(f"Error adding geosites in bulk: {e}")
+            return []
+
+    def track_user_locations_bulk(
+        self,
+        points: List[Tuple[int, float, float, Optional[float]]]
+    ) -> bool:
+        """
+        Insert a batch of user location points in a single round-trip
+
+        Uses execute_values to collapse N single-row INSERTs into
+        ceil(N/page_size) statements, letting PostgreSQL group WAL flushes
+
+        Args:
+            points: List of (user_id, latitude, longitude, accuracy) tuples
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not points:
+            return True
+        try:
+            rows = [(user_id, lon, lat, acc) for user_id, lat, lon, acc in points]
+            with self.db_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    extras.execute_values(
+                        cur,
+                        """
+                        INSERT INTO user_locations
+                        (user_id, location, accuracy)
+                        VALUES %s;
+                        """,
+                        rows,
+                        template="(%s, ST_SetSRID(ST_Point(%s, %s), 4326), %s)",
+                        page_size=500
+                    )
+
+                    conn.commit()
+                    return True
+        except Exception as e:
+            logger.error(f"Error tracking user locations in bulk: {e}")
+            return False
+
     def track_user_location(
         self,
         user_id: int,
@@ -495,54 +1219,112 @@ class GeospatialQueryManager:
     ) -> bool:
         """
         Track user location for geospatial analytics
-        
+
+        Points are buffered in-process and flushed as a batch once
+        LOCATION_FLUSH_SIZE entries accumulate or LOCATION_FLUSH_INTERVAL
+        seconds elapse, whichever comes first
+
         Args:
             user_id: User ID
             latitude: Latitude coordinate
             longitude: Longitude coordinate
             accuracy: Optional accuracy in meters
-        
+
         Returns:
-            True if successful, False otherwise
+            True if the point was buffered (or flushed) successfully
         """
-        try:
-            with self.db_manager.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        INSERT INTO user_locations 
-                        (user_id, location, accuracy)
-                        VALUES (%s, ST_SetSRID(ST_Point(%s, %s), 4326), %s);
-                    """, (user_id, longitude, latitude, accuracy))
-                    
-                    conn.commit()
-                    return True
-        except Exception as e:
-            logger.error(f"Error tracking user location: {e}")
+        with self._location_buffer_lock:
+            self._location_buffer.append((user_id, latitude, longitude, accuracy))
+            buffered = len(self._location_buffer)
+            self._ensure_flush_thread()
+
+        if buffered >= self.LOCATION_FLUSH_SIZE:
+            return self.flush_user_locations()
+        return True
+
+    def flush_user_locations(self) -> bool:
+        """
+        Flush any buffered user location points to the database
+
+        Returns:
+            True if the buffer was empty or flushed successfully
+        """
+        with self._location_buffer_lock:
+            if not self._location_buffer:
+                return True
+            points = list(self._location_buffer)
+            self._location_buffer.clear()
+
+        if not self.track_user_locations_bulk(points):
+            # Re-buffer on failure so points survive transient outages
+            with self._location_buffer_lock:
+                self._location_buffer.extendleft(reversed(points))
             return False
+        return True
+
+    def _ensure_flush_thread(self) -> None:
+        """Start the background flush thread on first buffered point"""
+        if self._location_flush_thread is None or not self._location_flush_thread.is_alive():
+            self._location_flush_stop.clear()
+            self._location_flush_thread = threading.Thread(
+                target=self._flush_loop,
+                name="user-location-flush",
+                daemon=True
+            )
+            self._location_flush_thread.start()
+            if not self._shutdown_registered:
+                atexit.register(self.shutdown)
+                self._shutdown_registered = True
+
+    def _flush_loop(self) -> None:
+        """Periodically flush buffered location points until shutdown"""
+        while not self._location_flush_stop.wait(self.LOCATION_FLUSH_INTERVAL):
+            self.flush_user_locations()
+
+    def shutdown(self) -> None:
+        """
+        Stop the background flush thread and flush any buffered points
+
+        Registered via atexit when the flush thread first starts, so up to
+        LOCATION_FLUSH_INTERVAL of buffered points is not lost on clean exit
+        """
+        self._location_flush_stop.set()
+        thread = self._location_flush_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=self.LOCATION_FLUSH_INTERVAL)
+        self.flush_user_locations()
     
     def get_user_location_history(
         self,
         user_id: int,
         limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Tuple[Any, ...]]:
         """
-        Get user location history
-        
+        Stream user location history
+
+        Uses a server-side (named) cursor so rows are fetched in bounded
+        batches via DECLARE/FETCH instead of buffering the whole result
+        client-side; memory stays constant however long the history is
+
         Args:
             user_id: User ID
             limit: Maximum number of records to return
-        
-        Returns:
-            List of user location records
+
+        Yields:
+            User location records (named tuples)
         """
         try:
             with self.db_manager.get_connection() as conn:
-                with conn.cursor(cursor_factory=extras.RealDictCursor) as cur:
+                with conn.cursor(
+                    name=f"loc_hist_{user_id}",
+                    cursor_factory=extras.NamedTupleCursor
+                ) as cur:
+                    cur.itersize = 500
                     cur.execute("""
-                        SELECT 
+                        SELECT
                             id,
                             user_id,
-                            ST_AsGeoJSON(location) as location_geojson,
+                            location_geojson,
                             timestamp,
                             accuracy
                         FROM user_locations
@@ -550,15 +1332,16 @@ class GeospatialQueryManager:
                         ORDER BY timestamp DESC
                         LIMIT %s;
                     """, (user_id, limit))
-                    
-                    return cur.fetchall()
+
+                    yield from cur
         except Exception as e:
             logger.error(f"Error retrieving user location history: {e}")
-            return []
+            return
 
 
 # Module-level database instance (singleton pattern)
 _db_manager: Optional[DatabaseManager] = None
+_query_manager: Optional[GeospatialQueryManager] = None
 
 
 def get_database_manager() -> DatabaseManager:
@@ -576,12 +1359,50 @@ def get_database_manager() -> DatabaseManager:
 
 def get_geospatial_query_manager() -> GeospatialQueryManager:
     """
-    Get a GeospatialQueryManager instance
-    
+    Get or create the global GeospatialQueryManager instance
+
+    A single shared instance is required for buffered location tracking:
+    the point buffer and its flush thread live on the manager, so per-call
+    instances would never accumulate a batch
+
     Returns:
         GeospatialQueryManager instance
     """
-    return GeospatialQueryManager(get_database_manager())
+    global _query_manager
+    if _query_manager is None:
+        _query_manager = GeospatialQueryManager(get_database_manager())
+    return _query_manager
+
+
+@lru_cache(maxsize=4096)
+def _haversine_meters(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> float:
+    """
+    Great-circle distance in meters on a spherical earth
+
+    Stays within ~0.5% of the PostGIS geodesic result, which is plenty for
+    ranking and display; memoized per rounded key so hot origin points
+    (e.g. popular trailheads) cost nothing after the first call
+
+    Args:
+        lat1: First point latitude (pre-rounded)
+        lon1: First point longitude (pre-rounded)
+        lat2: Second point latitude (pre-rounded)
+        lon2: Second point longitude (pre-rounded)
+
+    Returns:
+        Distance in meters
+    """
+    rlat1, rlon1, rlat2, rlon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((rlat2 - rlat1) / 2) ** 2
+        + math.cos(rlat1) * math.cos(rlat2) * math.sin((rlon2 - rlon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
 
 
 def initialize_database() -> bool:
@@ -592,12 +1413,9 @@ def initialize_database() -> bool:
         True if successful, False otherwise
     """
     db_manager = get_database_manager()
-    
-    if not db_manager.initialize_postgis():
-        return False
-    
-    if not db_manager.create_spatial_tables():
+
+    if not db_manager.initialize_schema():
         return False
-    
+
     logger.info("Database initialized successfully")
     return True